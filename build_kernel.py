@@ -0,0 +1,28 @@
+"""
+Ahead-of-time compile the cycle kernel with numba.pycc
+
+Run once after installing numba:  python build_kernel.py
+This writes a cycles_aot extension module next to main.py, which main.py then
+prefers and imports as a plain C extension - no LLVM, no JIT warm-up and no
+numba import at run time. The build is single-threaded; run main.py with
+CYCLES_KERNEL=numba to benchmark the multi-threaded JIT kernel instead.
+(numba.pycc is deprecated upstream.)
+"""
+import math
+import os
+
+from numba.pycc import CC
+
+cc = CC('cycles_aot')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+@cc.export('run', 'f8(i8, i8)')
+def run(start, stop):
+    """Sum of sqrt(i) * log(i + 1) over [start, stop)"""
+    s = 0.0
+    for i in range(max(start, 1), stop):
+        s += math.sqrt(i) * math.log(i + 1)
+    return s
+
+if __name__ == "__main__":
+    cc.compile()
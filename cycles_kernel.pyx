@@ -0,0 +1,17 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython build of the cycle kernel used by main.py
+
+Build in place with:  python setup.py build_ext --inplace
+"""
+from libc.math cimport sqrt, log
+
+def run(Py_ssize_t start, Py_ssize_t stop):
+    """Sum of sqrt(i) * log(i + 1) over [start, stop)"""
+    cdef Py_ssize_t i
+    cdef double s = 0.0
+    if start < 1:
+        start = 1
+    for i in range(start, stop):
+        s += sqrt(<double>i) * log(<double>(i + 1))
+    return s
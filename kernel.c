@@ -0,0 +1,27 @@
+/*
+ * Plain C build of the cycle kernel, loaded by main.py through ctypes.
+ *
+ * Linux:   cc -O3 -ffast-math -shared -fPIC -o libkernel.so kernel.c -lm
+ * macOS:   cc -O3 -ffast-math -shared -o libkernel.dylib kernel.c
+ * Windows: cl /O2 /fp:fast /LD kernel.c /Fe:kernel.dll
+ */
+#include <math.h>
+
+#ifdef _WIN32
+#define KERNEL_EXPORT __declspec(dllexport)
+#else
+#define KERNEL_EXPORT
+#endif
+
+/* Sum of sqrt(i) * log(i + 1) over [start, stop) */
+KERNEL_EXPORT double kernel(long long start, long long stop)
+{
+    double s = 0.0;
+    long long i;
+
+    if (start < 1)
+        start = 1;
+    for (i = start; i < stop; i++)
+        s += sqrt((double)i) * log((double)(i + 1));
+    return s;
+}
@@ -1,8 +1,31 @@
+import ctypes
+import os
 import time
 import sys
 import math
+from array import array
+from bisect import bisect_right
 from datetime import datetime
 
+# Interpreter details never change during a run
+_PYTHON_VERSION = sys.version.split()[0]
+_PLATFORM = sys.platform
+
+# ETA unit selection: bisect on the limits picks the (divisor, suffix) pair
+_ETA_LIMITS = (60, 3600)
+_ETA_UNITS = ((1, "s"), (60, "m"), (3600, "h"))
+
+# format_time units: bisect on the limits (in seconds) picks the
+# (nanosecond divisor, format spec, suffix) entry; past the table is >= 1 minute
+_TIME_LIMITS = (1e-9, 1e-6, 1e-3, 1, 60)
+_TIME_UNITS = (
+    (1, ".0f", "ns"),
+    (1_000, ".2f", "µs"),
+    (1_000_000, ".2f", "ms"),
+    (1_000_000_000, ".6f", "s"),
+    (1_000_000_000, ".3f", "s"),
+)
+
 class AdvancedProgressBar:
     """
     Advanced progress bar with multiple information displays
@@ -11,28 +34,60 @@ class AdvancedProgressBar:
         self.total = total
         self.desc = desc
         self.bar_length = bar_length
-        self.start_time = time.time()
+        # Every possible bar state, built and UTF-8 encoded once instead of on each redraw
+        self._bars = [('█' * k + '▒' * (bar_length - k)).encode('utf-8')
+                      for k in range(bar_length + 1)]
+        # Reused line buffer that always starts with the encoded prefix
+        self._line = bytearray(f"\r⏳ {desc} |".encode('utf-8'))
+        self._prefix_len = len(self._line)
+        # Length of the previous redraw, so a shorter line can blank out its tail
+        self._line_len = 0
+        # All timing uses perf_counter; the wall clock is only read once here
+        # and the displayed time of day is derived from it plus elapsed time
+        self.start_time = time.perf_counter()
+        self._start_wall = time.time()
         self.current = 0
-        self.iteration_times = []
+        # Ring buffer of the last sample_window per-iteration times with a running sum
+        self.sample_window = 100
+        self.iteration_times = [0.0] * self.sample_window
+        self._times_sum = 0.0
+        self._times_count = 0
+        self._times_index = 0
+        self.refresh_interval = 0.1
+        self._last_draw = 0.0
+        # Binary layer of stdout, when it has one (not e.g. in IDLE); going through
+        # it rather than os.write keeps Windows consoles Unicode-safe
+        self._out = getattr(sys.stdout, 'buffer', None)
+        # Wall clock text, reformatted only when the second changes
+        self._clock_sec = -1
+        self._clock_str = ""
         
     def update(self, current):
         """Update progress bar with performance metrics"""
         self.current = current
+        
+        # Redraw at most every refresh_interval seconds; always draw the final state
+        now = time.perf_counter()
+        if now - self._last_draw < self.refresh_interval and current < self.total:
+            return
+        self._last_draw = now
+        
         progress = min(current / self.total, 1.0)
         filled_length = int(self.bar_length * progress)
         
-        # Create the bar with different colors based on progress
-        bar = '█' * filled_length + '▒' * (self.bar_length - filled_length)
-        
         # Calculate timing information
-        elapsed_time = time.time() - self.start_time
-        current_time = datetime.now().strftime("%H:%M:%S")
+        elapsed_time = now - self.start_time
+        sec = int(self._start_wall + elapsed_time)
+        if sec != self._clock_sec:
+            self._clock_sec = sec
+            self._clock_str = time.strftime("%H:%M:%S", time.localtime(sec))
+        current_time = self._clock_str
         
         # Calculate performance metrics
         if elapsed_time > 0:
             speed = current / elapsed_time
-            if len(self.iteration_times) >= 2:
-                avg_iteration_time = sum(self.iteration_times) / len(self.iteration_times)
+            if self._times_count >= 2:
+                avg_iteration_time = self._times_sum / self._times_count
                 eta = avg_iteration_time * (self.total - current) if current > 0 else 0
             else:
                 eta = elapsed_time * (1 - progress) / progress if progress > 0 else 0
@@ -41,46 +96,175 @@ class AdvancedProgressBar:
             eta = 0
             
         # Format ETA
-        if eta < 60:
-            eta_str = f"{eta:.1f}s"
-        elif eta < 3600:
-            eta_str = f"{eta/60:.1f}m"
-        else:
-            eta_str = f"{eta/3600:.1f}h"
+        divisor, unit = _ETA_UNITS[bisect_right(_ETA_LIMITS, eta)]
+        eta_str = f"{eta/divisor:.1f}{unit}"
             
-        # Build progress line
-        progress_line = f"\r⏳ {self.desc} |{bar}| {progress*100:6.2f}% "
-        progress_line += f"| ⚡ {speed:7.0f}/s | 🕐 {self.format_time(elapsed_time)} "
-        progress_line += f"| 🎯 ETA: {eta_str} | 🕒 {current_time}"
+        # Build progress line: cached prefix + pre-encoded bar + metrics
+        line = self._line
+        line[self._prefix_len:] = self._bars[filled_length]
+        line += (
+            f"| {progress*100:6.2f}% "
+            f"| ⚡ {speed:7.0f}/s | 🕐 {format_time(elapsed_time * 1_000_000_000)} "
+            f"| 🎯 ETA: {eta_str} | 🕒 {current_time}"
+        ).encode('utf-8')
+        # Fields change width (e.g. elapsed going from 0.939739 s to 1.064 s); pad
+        # with spaces so nothing from the previous, longer redraw stays visible.
+        # Only ASCII fields vary, so the byte difference equals the column difference
+        if len(line) < self._line_len:
+            line += b" " * (self._line_len - len(line))
+        self._line_len = len(line)
         
-        sys.stdout.write(progress_line)
+        # Write the encoded line to the binary layer, bypassing the text codec;
+        # flush first so earlier print() output stays in order
         sys.stdout.flush()
+        if self._out is not None:
+            self._out.write(line)
+            self._out.flush()
+        else:
+            sys.stdout.write(line.decode('utf-8'))
+            sys.stdout.flush()
         
         # Record iteration time for averaging
         if current > 0:
             iter_time = elapsed_time / current
-            self.iteration_times.append(iter_time)
-            # Keep only last 100 samples
-            if len(self.iteration_times) > 100:
-                self.iteration_times.pop(0)
+            # Overwrite the oldest sample and adjust the running sum in O(1)
+            i = self._times_index
+            self._times_sum += iter_time - self.iteration_times[i]
+            self.iteration_times[i] = iter_time
+            self._times_index = (i + 1) % self.sample_window
+            if self._times_count < self.sample_window:
+                self._times_count += 1
         
     def finish(self):
         """Complete the progress bar"""
         self.update(self.total)
-        elapsed = time.time() - self.start_time
-        print(f"\n✅ Completed in {self.format_time(elapsed)}")
-        
-    def format_time(self, seconds):
-        """Format time in human readable format"""
-        if seconds < 60:
-            return f"{seconds:.1f}s"
-        elif seconds < 3600:
-            m, s = divmod(seconds, 60)
-            return f"{m:.0f}m {s:.0f}s"
-        else:
-            h, m = divmod(seconds, 3600)
-            m, s = divmod(m, 60)
-            return f"{h:.0f}h {m:.0f}m"
+        elapsed = time.perf_counter() - self.start_time
+        print(f"\n✅ Completed in {format_time(elapsed * 1_000_000_000)}")
+
+def _python_kernel(start, stop):
+    """Pure Python cycle kernel: sum of sqrt(i) * log(i + 1) over [start, stop)"""
+    # Bind to locals: LOAD_FAST is cheaper than a global + attribute lookup
+    sqrt = math.sqrt
+    log = math.log
+    s = 0.0
+    for i in range(max(start, 1), stop):
+        s += sqrt(i) * log(i + 1)
+    return s
+
+def _load_aot_kernel():
+    """numba.pycc build of the kernel (python build_kernel.py), if present"""
+    try:
+        from cycles_aot import run
+    except ImportError:
+        return None
+    return run
+
+def _load_cython_kernel():
+    """Cython build of the kernel (python setup.py build_ext --inplace), if present"""
+    try:
+        from cycles_kernel import run
+    except ImportError:
+        return None
+    return run
+
+def _load_numba_kernel():
+    """Numba JIT kernel; numba is only imported when this backend is tried"""
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    # fastmath lets LLVM reassociate the reduction and vectorize sqrt/log;
+    # numba picks up Intel SVML automatically when icc_rt is installed
+    # parallel=True turns the prange loop into a per-thread reduction on s
+    @numba.njit(parallel=True, fastmath=True, cache=True, boundscheck=False)
+    def _numba_kernel(start, stop):
+        """Numba-compiled cycle kernel (same math as _python_kernel)"""
+        s = 0.0
+        for i in numba.prange(max(start, 1), stop):
+            s += math.sqrt(i) * math.log(i + 1)
+        return s
+
+    return _numba_kernel
+
+def _load_c_kernel():
+    """Load the ctypes kernel built from kernel.c next to this file, if present"""
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in ("libkernel.so", "libkernel.dylib", "kernel.dll"):
+        path = os.path.join(here, name)
+        if os.path.exists(path):
+            # Skip a stale, wrong-architecture or symbol-less build and try the next
+            try:
+                kernel = ctypes.CDLL(path).kernel
+            except (OSError, AttributeError):
+                continue
+            kernel.restype = ctypes.c_double
+            kernel.argtypes = [ctypes.c_longlong, ctypes.c_longlong]
+            return kernel
+    return None
+
+# 64K float64 values = 512 KB per buffer, small enough to stay cache-resident
+_NP_BLOCK = 1 << 16
+
+def _load_numpy_kernel():
+    """Build the vectorized kernel together with its own scratch buffers"""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    offsets = np.arange(_NP_BLOCK, dtype=np.float64)
+    index = np.empty(_NP_BLOCK, dtype=np.float64)
+    scratch = np.empty(_NP_BLOCK, dtype=np.float64)
+
+    def _numpy_kernel(start, stop):
+        """Vectorized cycle kernel, evaluated in preallocated blocks"""
+        s = 0.0
+        for block_start in range(start, stop, _NP_BLOCK):
+            n = min(_NP_BLOCK, stop - block_start)
+            idx = np.add(offsets[:n], block_start, out=index[:n])
+            terms = np.sqrt(idx, out=scratch[:n])
+            terms *= np.log1p(idx, out=idx)
+            s += float(terms.sum())
+        return s
+
+    return _numpy_kernel
+
+# Kernel backends as (key, display name, loader), in default preference order.
+# Precompiled builds come first: they load as plain C extensions, so once built
+# they run without the numba import or any JIT step. The multi-threaded numba
+# JIT follows, then the remaining fallbacks. Set the CYCLES_KERNEL environment
+# variable to a key to benchmark one backend explicitly.
+_KERNELS = (
+    ("aot", "Numba AOT", _load_aot_kernel),
+    ("cython", "Cython", _load_cython_kernel),
+    ("numba", "Numba JIT", _load_numba_kernel),
+    ("c", "C (ctypes)", _load_c_kernel),
+    ("numpy", "NumPy", _load_numpy_kernel),
+    ("python", "Pure Python", lambda: _python_kernel),
+)
+
+def _select_kernel(choice=None):
+    """Return (kernel, name) for the chosen backend, or the first available one"""
+    for key, name, load in _KERNELS:
+        if choice and key != choice:
+            continue
+        kernel = load()
+        if kernel is not None:
+            return kernel, name
+    keys = ", ".join(key for key, _, _ in _KERNELS)
+    raise SystemExit(f"❌ Kernel '{choice}' is not available (choose from: {keys})")
+
+_kernel, KERNEL_NAME = _select_kernel(os.environ.get("CYCLES_KERNEL", "").strip().lower())
+
+def warm_up_kernel():
+    """
+    Run the kernel once so JIT compilation (or loading the numba cache)
+    happens outside the measured region; returns the warm-up time in ns
+    """
+    start = time.perf_counter_ns()
+    _kernel(0, 2)
+    return time.perf_counter_ns() - start
 
 def print_header(text, emoji="✨"):
     """Print formatted header"""
@@ -100,6 +284,11 @@ def print_info(key, value, emoji="🔹"):
 def perform_cycles(num_cycles):
     """
     Execute specified number of cycles with comprehensive monitoring
+
+    Call warm_up_kernel() first: the reported times exclude JIT compilation,
+    the same way compiled languages are benchmarked without their build step.
+    The kernel results are summed and returned as a checksum so no compiler
+    can discard the work as dead code.
     """
     print_header(f"EXECUTING {num_cycles:,} CYCLES", "🚀")
     
@@ -108,6 +297,7 @@ def perform_cycles(num_cycles):
     print_info("Start Time", datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "🕒")
     print_info("Total Cycles", f"{num_cycles:,}", "🔢")
     print_info("Estimated Memory", "Minimal", "💾")
+    print_info("Kernel", KERNEL_NAME, "🧮")
     
     # Start time measurement
     start_time = time.perf_counter_ns()
@@ -119,30 +309,41 @@ def perform_cycles(num_cycles):
     # Performance tracking
     performance_data = {
         'start_memory': 0,  # Could be added with psutil module
-        'cycle_times': [],
-        'batch_start': time.time()
+        'cycle_times': array('d', [0.0] * 10),  # one slot per 10% sample
+        'n_samples': 0,
+        'batch_start': time.perf_counter()
     }
     
     print_section("REAL-TIME PROGRESS", "📈")
     
-    # Execute cycles
-    batch_size = max(1, min(num_cycles // 100, 10000))
+    # Execute cycles in batches: the kernel runs a tight loop over each batch with
+    # no progress checks, and the bar is refreshed between kernel calls
+    batch_size = max(1, min(num_cycles // 100, 1_000_000))
+    sample_every = -(-num_cycles // 10)  # ceil, so there are at most 10 samples
+    next_sample = sample_every
     
-    for i in range(num_cycles):
-        # Simulate work - you can add real cycle logic here
-        # Example: simple calculation to simulate CPU work
-        result = math.sqrt(i) * math.log(i + 1) if i > 0 else 0
+    # Hoist hot-loop lookups into locals
+    kernel = _kernel
+    update = progress_bar.update
+    clock = time.perf_counter
+    checksum = 0.0
+    
+    for start in range(0, num_cycles, batch_size):
+        end = min(start + batch_size, num_cycles)
+        # Draw progress up to this batch; the final 100% state is drawn by finish()
+        update(start)
+        # Simulate CPU work - replace the kernel with real cycle logic if needed
+        checksum += kernel(start, end)
         
-        # Update progress at calculated intervals
-        if i % batch_size == 0 or i == num_cycles - 1:
-            progress_bar.update(i + 1)
-            
-            # Performance sampling (every 10%)
-            if i % (num_cycles // 10) == 0 and i > 0:
-                current_time = time.time()
-                batch_time = current_time - performance_data['batch_start']
-                performance_data['batch_start'] = current_time
-                performance_data['cycle_times'].append(batch_time / batch_size)
+        # Performance sampling (every 10%)
+        if end >= next_sample:
+            next_sample += sample_every
+            current_time = clock()
+            batch_time = current_time - performance_data['batch_start']
+            performance_data['batch_start'] = current_time
+            n = performance_data['n_samples']
+            performance_data['cycle_times'][n] = batch_time / sample_every
+            performance_data['n_samples'] = n + 1
     
     progress_bar.finish()
     
@@ -155,7 +356,7 @@ def perform_cycles(num_cycles):
     total_time_sec = total_time_ns / 1_000_000_000
     cpu_time_sec = end_cpu_time - start_cpu_time
     
-    return total_time_ns, total_time_sec, cpu_time_sec, performance_data
+    return total_time_ns, total_time_sec, cpu_time_sec, performance_data, checksum
 
 def format_time(nanoseconds):
     """
@@ -163,16 +364,10 @@ def format_time(nanoseconds):
     """
     seconds = nanoseconds / 1_000_000_000
     
-    if seconds < 1e-9:
-        return f"{nanoseconds:.0f} ns"
-    elif seconds < 1e-6:
-        return f"{nanoseconds/1000:.2f} µs"
-    elif seconds < 1e-3:
-        return f"{nanoseconds/1_000_000:.2f} ms"
-    elif seconds < 1:
-        return f"{seconds:.6f} s"
-    elif seconds < 60:
-        return f"{seconds:.3f} s"
+    index = bisect_right(_TIME_LIMITS, seconds)
+    if index < len(_TIME_UNITS):
+        divisor, spec, unit = _TIME_UNITS[index]
+        return f"{nanoseconds / divisor:{spec}} {unit}"
     else:
         m, s = divmod(seconds, 60)
         if m < 60:
@@ -217,7 +412,7 @@ def calculate_performance_metrics(num_cycles, total_time_sec, cpu_time_sec):
         
     return metrics
 
-def display_detailed_results(num_cycles, total_ns, total_sec, cpu_time_sec, metrics):
+def display_detailed_results(num_cycles, total_ns, total_sec, cpu_time_sec, metrics, checksum):
     """Display comprehensive results"""
     print_header("DETAILED PERFORMANCE RESULTS", "📊")
     
@@ -233,11 +428,12 @@ def display_detailed_results(num_cycles, total_ns, total_sec, cpu_time_sec, metr
     print_info("Cycles per Second", f"{metrics['cycles_per_second']:,.0f}", "🔁")
     print_info("Time per Cycle", format_time(metrics['seconds_per_cycle'] * 1e9), "⏳")
     print_info("Performance Rating", f"{metrics['rating']} {metrics['rating_emoji']}", "🏆")
+    print_info("Result Checksum", f"{checksum:.10e}", "🧮")
     
     # System Information
     print_section("SYSTEM INFORMATION", "💻")
-    print_info("Python Version", sys.version.split()[0], "🐍")
-    print_info("Platform", sys.platform, "🖥️")
+    print_info("Python Version", _PYTHON_VERSION, "🐍")
+    print_info("Platform", _PLATFORM, "🖥️")
     print_info("Completion Time", datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "✅")
 
 def display_predictions(num_cycles, metrics):
@@ -269,7 +465,11 @@ def display_predictions(num_cycles, metrics):
                 
             print_info(f"{cycles:>12,} cycles", f"{time_str} {emoji}", "📅")
 
-def main():
+def main(assume_yes=False):
+    """
+    Interactive entry point; assume_yes (or a non-interactive stdin) skips the
+    large-run confirmation so automated benchmark runs do not block
+    """
     print_header("ADVANCED CYCLE EXECUTION TIME ANALYZER", "🔬")
     print("Welcome to the comprehensive performance analysis tool!")
     print("This program measures execution time with nanosecond precision")
@@ -300,19 +500,24 @@ def main():
             estimated_time = num_cycles / 1000000  # Conservative estimate
             if estimated_time > 10:
                 print(f"⚠️  This may take approximately {estimated_time:.1f} seconds or more")
-            confirm = input("Continue? (y/N): ").lower()
-            if confirm not in ['y', 'yes']:
-                print("Operation cancelled.")
-                return
+            if not assume_yes and sys.stdin.isatty():
+                confirm = input("Continue? (y/N): ").lower()
+                if confirm not in ['y', 'yes']:
+                    print("Operation cancelled.")
+                    return
+        
+        # Compile/warm the kernel before anything is measured
+        warmup_ns = warm_up_kernel()
+        print(f"\n🔥 {KERNEL_NAME} kernel ready in {warmup_ns / 1_000_000:.3f} ms (excluded from timing)")
         
         # Execute and measure
-        total_ns, total_sec, cpu_time_sec, performance_data = perform_cycles(num_cycles)
+        total_ns, total_sec, cpu_time_sec, performance_data, checksum = perform_cycles(num_cycles)
         
         # Calculate metrics
         metrics = calculate_performance_metrics(num_cycles, total_sec, cpu_time_sec)
         
         # Display results
-        display_detailed_results(num_cycles, total_ns, total_sec, cpu_time_sec, metrics)
+        display_detailed_results(num_cycles, total_ns, total_sec, cpu_time_sec, metrics, checksum)
         
         # Display predictions
         display_predictions(num_cycles, metrics)
@@ -330,5 +535,6 @@ def main():
         print("Please try again with a different number of cycles.")
 
 if __name__ == "__main__":
-    main()
-    input("\n🎯 Press Enter to exit...")
\ No newline at end of file
+    main(assume_yes=any(arg in ("-y", "--yes") for arg in sys.argv[1:]))
+    if sys.stdin.isatty():
+        input("\n🎯 Press Enter to exit...")
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""
+Build the optional Cython cycle kernel:  python setup.py build_ext --inplace
+"""
+import sys
+from setuptools import setup, Extension
+from Cython.Build import cythonize
+
+if sys.platform == "win32":
+    compile_args = ["/O2", "/fp:fast"]
+else:
+    compile_args = ["-O3", "-ffast-math"]
+
+extensions = [
+    Extension("cycles_kernel", ["cycles_kernel.pyx"], extra_compile_args=compile_args),
+]
+
+setup(
+    name="cycles_kernel",
+    ext_modules=cythonize(
+        extensions,
+        compiler_directives={
+            "language_level": 3,
+            "boundscheck": False,
+            "wraparound": False,
+            "cdivision": True,
+        },
+    ),
+)